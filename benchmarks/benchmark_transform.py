@@ -12,3 +12,6 @@ class TransformSuite:
 
     def time_hough_line(self):
         result1, result2, result3 = transform.hough_line(self.image)
+
+    def time_integral_image(self):
+        transform.integral_image(self.image)
@@ -30,6 +30,11 @@ These steps are performed either a maximum number of times or until one of
 the special stop criteria are met. The final model is estimated using all the
 inlier samples of the previously determined best model.
 
+Here, ``stop_probability`` ends the iterations as soon as an outlier-free
+random subset has been drawn with a probability of at least 99%, given the
+inlier ratio of the current best model. With many inliers, this requires far
+fewer trials than ``max_trials``.
+
 """
 import numpy as np
 from matplotlib import pyplot as plt
@@ -44,15 +49,13 @@ y = 0.2 * x + 20
 data = np.column_stack([x, y])
 
 # add gaussian noise to coordinates
-noise = rng.normal(size=data.shape)
+noise = rng.standard_normal(data.shape)
 data += 0.5 * noise
 data[::2] += 5 * noise[::2]
 data[::4] += 20 * noise[::4]
 
 # add faulty data
-faulty = np.array(30 * [(180., -100)])
-faulty += 10 * rng.normal(size=faulty.shape)
-data[:faulty.shape[0]] = faulty
+data[:30] = rng.normal(loc=(180., -100.), scale=10, size=(30, 2))
 
 # fit line using all data
 model = LineModelND()
@@ -60,8 +63,9 @@ model.estimate(data)
 
 # robustly fit line only using inlier data with RANSAC algorithm
 model_robust, inliers = ransac(data, LineModelND, min_samples=2,
-                               residual_threshold=1, max_trials=1000)
-outliers = (inliers == False)
+                               residual_threshold=1, max_trials=1000,
+                               stop_probability=0.99)
+outliers = ~inliers
 
 # generate coordinates of estimated models
 line_x = np.arange(-250, 250)
@@ -93,15 +97,16 @@ direction = np.array([1, 1, 1], dtype='float') / np.sqrt(3)
 xyz = point + 10 * np.arange(-100, 100)[..., np.newaxis] * direction
 
 # add gaussian noise to coordinates
-noise = rng.normal(size=xyz.shape)
+noise = rng.standard_normal(xyz.shape)
 xyz += 0.5 * noise
 xyz[::2] += 20 * noise[::2]
 xyz[::4] += 100 * noise[::4]
 
 # robustly fit line only using inlier data with RANSAC algorithm
 model_robust, inliers = ransac(xyz, LineModelND, min_samples=2,
-                               residual_threshold=1, max_trials=1000)
-outliers = inliers == False
+                               residual_threshold=1, max_trials=1000,
+                               stop_probability=0.99)
+outliers = ~inliers
 
 fig = plt.figure()
 ax = fig.add_subplot(111, projection='3d')
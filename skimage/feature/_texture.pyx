@@ -4,9 +4,9 @@
 #cython: wraparound=False
 import numpy as np
 cimport numpy as cnp
-from libc.math cimport sin, cos
+from libc.math cimport sin, cos, floor, ceil
+from cython.parallel cimport prange
 from .._shared.interpolation cimport bilinear_interpolation, round
-from .._shared.transform cimport integrate
 
 cdef extern from "numpy/npy_math.h":
     cnp.float64_t NAN "NPY_NAN"
@@ -15,16 +15,23 @@ from .._shared.fused_numerics cimport np_anyint as any_int
 
 cnp.import_array()
 
+# Image types supported natively by `_local_binary_pattern`, other types are
+# converted to float64 before calling it.
+ctypedef fused lbp_image_t:
+    cnp.uint8_t
+    cnp.float32_t
+    cnp.float64_t
+
 def _glcm_loop(any_int[:, ::1] image, cnp.float64_t[:] distances,
                cnp.float64_t[:] angles, Py_ssize_t levels,
-               cnp.uint32_t[:, :, :, ::1] out):
+               cnp.uint32_t[:, :, :, ::1] out, bint symmetric=False):
     """Perform co-occurrence matrix accumulation.
 
     Parameters
     ----------
     image : ndarray
-        Integer typed input image. Only positive valued images are supported.
-        If type is other than uint8, the argument `levels` needs to be set.
+        Integer typed input image. All values must be in [0, `levels`-1],
+        which is not checked here but validated by `graycomatrix`.
     distances : ndarray
         List of pixel pair distance offsets.
     angles : ndarray
@@ -36,38 +43,49 @@ def _glcm_loop(any_int[:, ::1] image, cnp.float64_t[:] distances,
     out : ndarray
         On input a 4D array of zeros, and on output it contains
         the results of the GLCM computation.
+    symmetric : bool, optional
+        If True, each pair is also counted in the transposed position, so
+        that `out` is the sum of the GLCM and its transpose.
 
     """
 
     cdef:
         Py_ssize_t a_idx, d_idx, r, c, rows, cols, row, col, start_row,\
                    end_row, start_col, end_col, offset_row, offset_col
+        Py_ssize_t pair_idx, n_angles, n_pairs
         any_int i, j
         cnp.float64_t angle, distance
 
     with nogil:
         rows = image.shape[0]
         cols = image.shape[1]
-
-        for a_idx in range(angles.shape[0]):
+        n_angles = angles.shape[0]
+        n_pairs = distances.shape[0] * n_angles
+
+        # Each (distance, angle) pair only writes to its own
+        # out[:, :, d_idx, a_idx] slice, so the pairs can be processed in
+        # parallel without any synchronization.
+        for pair_idx in prange(n_pairs):
+            d_idx = pair_idx // n_angles
+            a_idx = pair_idx % n_angles
             angle = angles[a_idx]
-            for d_idx in range(distances.shape[0]):
-                distance = distances[d_idx]
-                offset_row = round(sin(angle) * distance)
-                offset_col = round(cos(angle) * distance)
-                start_row = max(0, -offset_row)
-                end_row = min(rows, rows - offset_row)
-                start_col = max(0, -offset_col)
-                end_col = min(cols, cols - offset_col)
-                for r in range(start_row, end_row):
-                    for c in range(start_col, end_col):
-                        i = image[r, c]
-                        # compute the location of the offset pixel
-                        row = r + offset_row
-                        col = c + offset_col
-                        j = image[row, col]
-                        if 0 <= i < levels and 0 <= j < levels:
-                            out[i, j, d_idx, a_idx] += 1
+            distance = distances[d_idx]
+            offset_row = round(sin(angle) * distance)
+            offset_col = round(cos(angle) * distance)
+            start_row = max(0, -offset_row)
+            end_row = min(rows, rows - offset_row)
+            start_col = max(0, -offset_col)
+            end_col = min(cols, cols - offset_col)
+            for r in range(start_row, end_row):
+                for c in range(start_col, end_col):
+                    i = image[r, c]
+                    # compute the location of the offset pixel
+                    row = r + offset_row
+                    col = c + offset_col
+                    j = image[row, col]
+                    out[i, j, d_idx, a_idx] += 1
+                    if symmetric:
+                        out[j, i, d_idx, a_idx] += 1
 
 
 cdef inline int _bit_rotate_right(int value, int length) nogil:
@@ -84,15 +102,40 @@ cdef inline int _bit_rotate_right(int value, int length) nogil:
     return (value >> 1) | ((value & 1) << (length - 1))
 
 
-def _local_binary_pattern(cnp.float64_t[:, ::1] image,
-                          int P, cnp.float64_t R, char method=b'D'):
+cdef inline cnp.float64_t _bilinear_inside(lbp_image_t* image,
+                                          Py_ssize_t cols,
+                                          cnp.float64_t r,
+                                          cnp.float64_t c) nogil:
+    """Bilinear interpolation at a position whose four surrounding pixels
+    all lie inside the image.
+
+    The arithmetic is the same as in `bilinear_interpolation`, so the results
+    are identical, but the pixels are read without any boundary handling.
+    """
+    cdef:
+        long minr = <long>floor(r)
+        long minc = <long>floor(c)
+        long maxr = <long>ceil(r)
+        long maxc = <long>ceil(c)
+        cnp.float64_t dr = r - minr
+        cnp.float64_t dc = c - minc
+        cnp.float64_t top, bottom
+
+    top = (1 - dc) * image[minr * cols + minc] + dc * image[minr * cols + maxc]
+    bottom = ((1 - dc) * image[maxr * cols + minc]
+              + dc * image[maxr * cols + maxc])
+    return (1 - dr) * top + dr * bottom
+
+
+def _local_binary_pattern(lbp_image_t[:, ::1] image,
+                          int P, cnp.float64_t R, char method=ord('D')):
     """Gray scale and rotation invariant LBP (Local Binary Patterns).
 
     LBP is an invariant descriptor that can be used for texture classification.
 
     Parameters
     ----------
-    image : (N, M) cnp.float64_t array
+    image : (N, M) array of uint8, float32 or float64
         Graylevel image.
     P : int
         Number of circularly symmetric neighbor set points (quantization of
@@ -121,6 +164,10 @@ def _local_binary_pattern(cnp.float64_t[:, ::1] image,
     cc = R * np.cos(2 * np.pi * np.arange(P, dtype=np.float64) / P)
     cdef cnp.float64_t[::1] rp = np.round(rr, 5)
     cdef cnp.float64_t[::1] cp = np.round(cc, 5)
+    # pixels at least `margin` away from the image border have all their
+    # texture elements inside the image
+    cdef Py_ssize_t margin = int(np.ceil(max(np.max(np.abs(rp)),
+                                             np.max(np.abs(cp)))))
 
     # pre-allocate arrays for computation
     cdef cnp.float64_t[::1] texture = np.zeros(P, dtype=np.float64)
@@ -144,10 +191,16 @@ def _local_binary_pattern(cnp.float64_t[:, ::1] image,
     with nogil:
         for r in range(image.shape[0]):
             for c in range(image.shape[1]):
-                for i in range(P):
-                    bilinear_interpolation[cnp.float64_t, cnp.float64_t, cnp.float64_t](
-                            &image[0, 0], rows, cols, r + rp[i], c + cp[i],
-                            b'C', 0, &texture[i])
+                if (margin <= r < rows - margin
+                        and margin <= c < cols - margin):
+                    for i in range(P):
+                        texture[i] = _bilinear_inside(&image[0, 0], cols,
+                                                      r + rp[i], c + cp[i])
+                else:
+                    for i in range(P):
+                        bilinear_interpolation[lbp_image_t, cnp.float64_t, cnp.float64_t](
+                                &image[0, 0], rows, cols, r + rp[i], c + cp[i],
+                                b'C', 0, &texture[i])
                 # signed / thresholded texture
                 for i in range(P):
                     if texture[i] - image[r, c] >= 0:
@@ -271,13 +324,26 @@ def _local_binary_pattern(cnp.float64_t[:, ::1] image,
 
 
 # Constant values that are used by `_multiblock_lbp` function.
-# Values represent offsets of neighbor rectangles relative to central one.
+# Values represent the (row, column) indices of the neighbor rectangles in the
+# 3x3 grid of rectangles, the central one being (1, 1).
 # It has order starting from top left and going clockwise.
 cdef:
-    Py_ssize_t[::1] mlbp_r_offsets = np.asarray([-1, -1, -1, 0, 1, 1, 1, 0],
-                                                dtype=np.intp)
-    Py_ssize_t[::1] mlbp_c_offsets = np.asarray([-1, 0, 1, 1, 1, 0, -1, -1],
-                                                dtype=np.intp)
+    Py_ssize_t mlbp_r_blocks[8]
+    Py_ssize_t mlbp_c_blocks[8]
+
+mlbp_r_blocks[:] = [0, 0, 0, 1, 2, 2, 2, 1]
+mlbp_c_blocks[:] = [0, 1, 2, 2, 2, 1, 0, 0]
+
+
+cdef inline np_floats _mlbp_block_sum(np_floats* corners,
+                                      Py_ssize_t i, Py_ssize_t j) nogil:
+    """Sum of the (i, j) rectangle from the 4x4 grid of integral image
+    values sampled at the rectangle corners.
+
+    The terms are accumulated in the same order as in `integrate`.
+    """
+    return (corners[4 * (i + 1) + j + 1] + corners[4 * i + j]
+            - corners[4 * i + j + 1] - corners[4 * (i + 1) + j])
 
 
 cpdef int _multiblock_lbp(np_floats[:, ::1] int_image,
@@ -317,40 +383,31 @@ cpdef int _multiblock_lbp(np_floats[:, ::1] int_image,
     """
 
     cdef:
-        # Top-left coordinates of central rectangle.
-        Py_ssize_t central_rect_r = r + height
-        Py_ssize_t central_rect_c = c + width
-
-        Py_ssize_t r_shift = height - 1
-        Py_ssize_t c_shift = width - 1
-
-        Py_ssize_t current_rect_r, current_rect_c
+        # The nine rectangles share their corners, so the integral image is
+        # only sampled on a 4x4 grid instead of four times per rectangle.
+        np_floats corners[16]
+        np_floats central_rect_val
+        Py_ssize_t i, j, corner_r, corner_c
         Py_ssize_t element_num
-        np_floats current_rect_val
-        int has_greater_value
         int lbp_code = 0
 
+    for i in range(4):
+        corner_r = r + i * height - 1
+        for j in range(4):
+            corner_c = c + j * width - 1
+            if corner_r < 0 or corner_c < 0:
+                corners[4 * i + j] = 0
+            else:
+                corners[4 * i + j] = int_image[corner_r, corner_c]
+
     # Sum of intensity values of central rectangle.
-    cdef np_floats central_rect_val = integrate(int_image, central_rect_r,
-                                                central_rect_c,
-                                                central_rect_r + r_shift,
-                                                central_rect_c + c_shift)
+    central_rect_val = _mlbp_block_sum(corners, 1, 1)
 
     for element_num in range(8):
-
-        current_rect_r = central_rect_r + mlbp_r_offsets[element_num]*height
-        current_rect_c = central_rect_c + mlbp_c_offsets[element_num]*width
-
-
-        current_rect_val = integrate(int_image, current_rect_r, current_rect_c,
-                                     current_rect_r + r_shift,
-                                     current_rect_c + c_shift)
-
-
-        has_greater_value = current_rect_val >= central_rect_val
-
         # If current rectangle's intensity value is bigger
         # make corresponding bit to 1.
-        lbp_code |= has_greater_value << (7 - element_num)
+        lbp_code |= (_mlbp_block_sum(corners, mlbp_r_blocks[element_num],
+                                     mlbp_c_blocks[element_num])
+                     >= central_rect_val) << (7 - element_num)
 
     return lbp_code
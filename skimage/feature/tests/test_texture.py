@@ -4,6 +4,7 @@ import pytest
 from skimage._shared.testing import expected_warnings, test_parallel
 from skimage.feature import (graycomatrix, graycoprops,
                              local_binary_pattern, multiblock_lbp)
+from skimage.feature._texture import _local_binary_pattern
 from skimage.transform import integral_image
 
 
@@ -235,6 +236,31 @@ class TestLBP():
                         [  3,   5,   0, 255,   1,   3]])
         np.testing.assert_array_equal(lbp, ref)
 
+    @pytest.mark.parametrize('dtype', [np.uint8, np.uint16, np.int32,
+                                       np.int64])
+    @pytest.mark.parametrize('method', ['default', 'ror', 'uniform',
+                                        'nri_uniform', 'var'])
+    def test_integer_dtypes(self, dtype, method):
+        lbp = local_binary_pattern(self.image.astype(dtype), 8, 1.5, method)
+        ref = local_binary_pattern(self.image, 8, 1.5, method)
+        np.testing.assert_array_equal(lbp, ref)
+
+    @pytest.mark.parametrize('dtype', [np.uint8, np.float32, np.float64])
+    @pytest.mark.parametrize('finite', [True, False])
+    @pytest.mark.parametrize('P, R', [(1, 1), (2, 3), (4, 1), (4, 2)])
+    def test_default_integer_offsets(self, dtype, finite, P, R):
+        image = self.image.astype(dtype)
+        if image.dtype.kind == 'f':
+            image[1, 1] = 0.5
+            if not finite:
+                image[0, 1] = np.inf
+                image[2, 3] = -np.inf
+                image[4, 1] = np.nan
+        with expected_warnings(['floating-point|\\A\\Z']):
+            lbp = local_binary_pattern(image, P, R, 'default')
+        ref = _local_binary_pattern(image, P, R, ord('D'))
+        np.testing.assert_array_equal(lbp, ref)
+
     @pytest.mark.parametrize('dtype', [np.float16, np.float32, np.float64])
     def test_float_warning(self, dtype):
         image = self.image.astype(dtype)
@@ -316,3 +342,28 @@ class TestMBLBP():
         lbp_code = multiblock_lbp(int_img, 0, 0, 3, 3)
 
         np.testing.assert_equal(lbp_code, correct_answer)
+
+    def test_mblbp_list_input(self):
+        rng = np.random.default_rng(0)
+        int_img = integral_image(rng.integers(0, 256, size=(9, 9)))
+        np.testing.assert_equal(multiblock_lbp(int_img.tolist(), 0, 0, 3, 3),
+                                multiblock_lbp(int_img, 0, 0, 3, 3))
+
+    @pytest.mark.parametrize('r, c, width, height',
+                             [(0, 0, 2, 3), (1, 2, 3, 2), (4, 0, 1, 1)])
+    def test_mblbp_block_sums(self, r, c, width, height):
+        rng = np.random.default_rng(0)
+        test_img = rng.integers(0, 256, size=(12, 12)).astype(np.uint8)
+        int_img = integral_image(test_img)
+
+        # Brute-force sums of the 3x3 grid of rectangles, compared clockwise
+        # from the top left one against the central one.
+        sums = test_img[r:r + 3 * height, c:c + 3 * width].astype(np.int64)
+        sums = sums.reshape(3, height, 3, width).sum(axis=(1, 3))
+        neighbors = sums[[0, 0, 0, 1, 2, 2, 2, 1], [0, 1, 2, 2, 2, 1, 0, 0]]
+        bits = neighbors >= sums[1, 1]
+        correct_answer = int(np.sum(bits << np.arange(7, -1, -1)))
+
+        lbp_code = multiblock_lbp(int_img, r, c, width, height)
+
+        assert lbp_code == correct_answer
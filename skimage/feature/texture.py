@@ -140,20 +140,16 @@ def graycomatrix(image, distances, angles, levels=None, symmetric=False,
     P = np.zeros((levels, levels, len(distances), len(angles)),
                  dtype=np.uint32, order='C')
 
-    # count co-occurences
-    _glcm_loop(image, distances, angles, levels, P)
+    # count co-occurences; a symmetric GLCM also counts each pair in the
+    # transposed position, which is the same as adding P.T to P
+    _glcm_loop(image, distances, angles, levels, P, symmetric)
 
-    # make each GLMC symmetric
-    if symmetric:
-        Pt = np.transpose(P, (1, 0, 2, 3))
-        P = P + Pt
-
-    # normalize each GLCM
+    # normalize each GLCM; the division casts to float64, which avoids a
+    # separate float64 copy of the counts
     if normed:
-        P = P.astype(np.float64)
-        glcm_sums = np.sum(P, axis=(0, 1), keepdims=True)
+        glcm_sums = np.sum(P, axis=(0, 1), dtype=np.float64, keepdims=True)
         glcm_sums[glcm_sums == 0] = 1
-        P /= glcm_sums
+        P = P / glcm_sums
 
     return P
 
@@ -233,10 +229,9 @@ def graycoprops(P, prop='contrast'):
         raise ValueError('num_angle must be positive.')
 
     # normalize each GLCM
-    P = P.astype(np.float64)
-    glcm_sums = np.sum(P, axis=(0, 1), keepdims=True)
+    glcm_sums = np.sum(P, axis=(0, 1), dtype=np.float64, keepdims=True)
     glcm_sums[glcm_sums == 0] = 1
-    P /= glcm_sums
+    P = P / glcm_sums
 
     # create weights for specified property
     I, J = np.ogrid[0:num_level, 0:num_level]
@@ -251,34 +246,35 @@ def graycoprops(P, prop='contrast'):
     else:
         raise ValueError(f'{prop} is an invalid property')
 
-    # compute property for each GLCM
+    # compute property for each GLCM; the multiply and reduce steps are
+    # fused with einsum to avoid any (levels, levels, D, A) temporaries
     if prop == 'energy':
-        asm = np.sum(P ** 2, axis=(0, 1))
+        asm = np.einsum('ijda,ijda->da', P, P)
         results = np.sqrt(asm)
     elif prop == 'ASM':
-        results = np.sum(P ** 2, axis=(0, 1))
+        results = np.einsum('ijda,ijda->da', P, P)
     elif prop == 'correlation':
         results = np.zeros((num_dist, num_angle), dtype=np.float64)
-        I = np.array(range(num_level)).reshape((num_level, 1, 1, 1))
-        J = np.array(range(num_level)).reshape((1, num_level, 1, 1))
-        diff_i = I - np.sum(I * P, axis=(0, 1))
-        diff_j = J - np.sum(J * P, axis=(0, 1))
-
-        std_i = np.sqrt(np.sum(P * (diff_i) ** 2, axis=(0, 1)))
-        std_j = np.sqrt(np.sum(P * (diff_j) ** 2, axis=(0, 1)))
-        cov = np.sum(P * (diff_i * diff_j), axis=(0, 1))
+        I = np.arange(num_level, dtype=np.float64)
+        # the means and variances only depend on the marginal distributions,
+        # so the full GLCMs are only needed for the covariance
+        P_i = np.sum(P, axis=1)
+        P_j = np.sum(P, axis=0)
+        diff_i = I[:, np.newaxis, np.newaxis] - np.einsum('i,ida->da', I, P_i)
+        diff_j = I[:, np.newaxis, np.newaxis] - np.einsum('j,jda->da', I, P_j)
+
+        std_i = np.sqrt(np.einsum('ida,ida->da', P_i, diff_i ** 2))
+        std_j = np.sqrt(np.einsum('jda,jda->da', P_j, diff_j ** 2))
+        cov = np.einsum('ijda,ida,jda->da', P, diff_i, diff_j)
 
         # handle the special case of standard deviations near zero
-        mask_0 = std_i < 1e-15
-        mask_0[std_j < 1e-15] = True
+        mask_0 = (std_i < 1e-15) | (std_j < 1e-15)
         results[mask_0] = 1
 
         # handle the standard case
-        mask_1 = ~mask_0
-        results[mask_1] = cov[mask_1] / (std_i[mask_1] * std_j[mask_1])
+        np.divide(cov, std_i * std_j, out=results, where=~mask_0)
     elif prop in ['contrast', 'dissimilarity', 'homogeneity']:
-        weights = weights.reshape((num_level, num_level, 1, 1))
-        results = np.sum(P * weights, axis=(0, 1))
+        results = np.einsum('ijda,ij->da', P, weights)
 
     return results
 
@@ -355,11 +351,61 @@ def local_binary_pattern(image, P, R, method='default'):
             "give unexpected results when small numerical differences between "
             "adjacent pixels are present. It is recommended to use this "
             "function with images of integer dtype.")
-    image = np.ascontiguousarray(image, dtype=np.float64)
+    # The comparisons with the center pixel are exact in the input dtype, so
+    # the common dtypes are passed as is instead of being cast to float64.
+    if image.dtype not in (np.uint8, np.float32, np.float64):
+        image = image.astype(np.float64)
+    image = np.ascontiguousarray(image)
+    # non-finite values spread to the zero-weight terms of the interpolation
+    # in the Cython loop, which the shifted comparisons below do not mimic
+    if (method.lower() == 'default' and 0 < P < 32
+            and (image.dtype.kind != 'f' or np.isfinite(image).all())):
+        # local position of texture elements, as in `_local_binary_pattern`
+        angles = 2 * np.pi * np.arange(P, dtype=np.float64) / P
+        rp = np.round(-R * np.sin(angles), 5)
+        cp = np.round(R * np.cos(angles), 5)
+        if np.all(rp == np.round(rp)) and np.all(cp == np.round(cp)):
+            return _lbp_default_integer_offsets(image, rp.astype(np.intp),
+                                                cp.astype(np.intp))
     output = _local_binary_pattern(image, P, R, methods[method.lower()])
     return output
 
 
+def _lbp_default_integer_offsets(image, rp, cp):
+    """Default LBP for texture elements lying exactly on pixel centers.
+
+    The interpolation then reduces to reading shifted pixels (zero outside
+    the image), so each bit of the pattern is computed for the whole image at
+    once by comparing a shifted view with the image.
+
+    Parameters
+    ----------
+    image : (M, N) array
+        2D grayscale image of dtype uint8, float32 or float64 with finite
+        values.
+    rp, cp : (P,) array of int
+        Row and column offsets of the texture elements.
+
+    Returns
+    -------
+    output : (M, N) array
+        LBP image.
+    """
+    rows, cols = image.shape
+    margin = int(max(np.max(np.abs(rp)), np.max(np.abs(cp)), 0))
+    padded = np.pad(image, margin)
+    lbp = np.zeros(image.shape, dtype=np.min_scalar_type(2 ** len(rp) - 1))
+    bit = np.empty(image.shape, dtype=bool)
+    for i, (dr, dc) in enumerate(zip(rp, cp)):
+        texture = padded[margin + dr:margin + dr + rows,
+                         margin + dc:margin + dc + cols]
+        # for finite values, ``texture >= center`` has the same outcome as
+        # the ``texture - center >= 0`` test of the Cython loop
+        np.greater_equal(texture, image, out=bit)
+        lbp |= bit.astype(lbp.dtype) << i
+    return lbp.astype(np.float64)
+
+
 def multiblock_lbp(int_image, r, c, width, height):
     """Multi-block local binary pattern (MB-LBP).
 
@@ -402,8 +448,14 @@ def multiblock_lbp(int_image, r, c, width, height):
            :DOI:`10.1007/978-3-540-74549-5_2`
     """
 
-    int_image = np.ascontiguousarray(int_image, dtype=np.float32)
-    lbp_code = _multiblock_lbp(int_image, r, c, width, height)
+    # Only the 4x4 grid of rectangle corners is read, so convert the window
+    # spanning them instead of the whole integral image.
+    int_image = np.asarray(int_image)
+    r0 = max(r - 1, 0)
+    c0 = max(c - 1, 0)
+    window = int_image[r0:r + 3 * height, c0:c + 3 * width]
+    window = np.ascontiguousarray(window, dtype=np.float32)
+    lbp_code = _multiblock_lbp(window, r - r0, c - c0, width, height)
     return lbp_code
 
 
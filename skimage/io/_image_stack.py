@@ -1,16 +1,24 @@
+from collections import deque
+
 import numpy as np
 
 
-__all__ = ['image_stack', 'push', 'pop']
+__all__ = ['image_stack', 'push', 'pop', 'set_stack_size']
 
 
 # Shared image queue
-image_stack = []
+image_stack = deque()
+
+# Maximum number of images kept on the stack
+_stack_size = 16
 
 
 def push(img):
     """Push an image onto the shared image stack.
 
+    If the stack is full (see `set_stack_size`), the oldest image is
+    discarded.
+
     Parameters
     ----------
     img : ndarray
@@ -21,6 +29,8 @@ def push(img):
         raise ValueError("Can only push ndarrays to the image stack.")
 
     image_stack.append(img)
+    while len(image_stack) > _stack_size:
+        image_stack.popleft()
 
 
 def pop():
@@ -33,3 +43,23 @@ def pop():
 
     """
     return image_stack.pop()
+
+
+def set_stack_size(size):
+    """Set the maximum number of images kept on the shared image stack.
+
+    The oldest images are discarded from the stack if it holds more than
+    `size` images.
+
+    Parameters
+    ----------
+    size : int
+        Maximum number of images on the stack (16 by default).
+
+    """
+    global _stack_size
+    if size < 1:
+        raise ValueError("The image stack size must be at least 1.")
+    _stack_size = int(size)
+    while len(image_stack) > _stack_size:
+        image_stack.popleft()
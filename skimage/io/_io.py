@@ -1,11 +1,11 @@
+import functools
 import pathlib
 
 import numpy as np
 
 from .._shared.utils import warn
-from ..exposure import is_low_contrast
-from ..color.colorconv import rgb2gray, rgba2rgb
 from ..io.manage_plugins import call_plugin
+from .collection import ImageCollection
 from .util import file_or_url_context
 
 
@@ -57,10 +57,12 @@ def imread(fname, as_gray=False, plugin=None, **plugin_args):
 
     if img.ndim > 2:
         if img.shape[-1] not in (3, 4) and img.shape[-3] in (3, 4):
-            img = np.swapaxes(img, -1, -3)
-            img = np.swapaxes(img, -2, -3)
+            # single view with the channels moved last
+            img = np.moveaxis(img, -3, -1)
 
         if as_gray:
+            # imported here to keep skimage.color out of `import skimage.io`
+            from ..color.colorconv import rgb2gray, rgba2rgb
             if img.shape[2] == 4:
                 img = rgba2rgb(img)
             img = rgb2gray(img)
@@ -68,8 +70,36 @@ def imread(fname, as_gray=False, plugin=None, **plugin_args):
     return img
 
 
+class _LRUCachedFunction:
+    """Picklable `functools.lru_cache` of a function.
+
+    Only the function and the size of the cache are pickled, not the cached
+    values.
+    """
+
+    def __init__(self, func, maxsize):
+        self.func = func
+        self.maxsize = maxsize
+        self._cached_func = functools.lru_cache(maxsize=maxsize)(func)
+
+    def __call__(self, *args, **kwargs):
+        return self._cached_func(*args, **kwargs)
+
+    def cache_info(self):
+        return self._cached_func.cache_info()
+
+    def cache_clear(self):
+        self._cached_func.cache_clear()
+
+    def __getstate__(self):
+        return {'func': self.func, 'maxsize': self.maxsize}
+
+    def __setstate__(self, state):
+        self.__init__(state['func'], state['maxsize'])
+
+
 def imread_collection(load_pattern, conserve_memory=True,
-                      plugin=None, **plugin_args):
+                      plugin=None, cache_size=0, **plugin_args):
     """
     Load a collection of images.
 
@@ -82,6 +112,15 @@ def imread_collection(load_pattern, conserve_memory=True,
     conserve_memory : bool, optional
         If True, never keep more than one in memory at a specific
         time.  Otherwise, images will be cached once they are loaded.
+    plugin : str, optional
+        Name of plugin to use.
+    cache_size : int, optional
+        With `conserve_memory`, keep up to this number of the most recently
+        loaded images in memory, so that accessing them again does not read
+        them from disk. The memory used grows to `cache_size` times the
+        size of an image. The `plugin_args` have to be hashable.
+
+        .. versionadded:: 0.21
 
     Returns
     -------
@@ -94,8 +133,12 @@ def imread_collection(load_pattern, conserve_memory=True,
         Passed to the given plugin.
 
     """
-    return call_plugin('imread_collection', load_pattern, conserve_memory,
-                       plugin=plugin, **plugin_args)
+    ic = call_plugin('imread_collection', load_pattern, conserve_memory,
+                     plugin=plugin, **plugin_args)
+    if (cache_size > 0 and conserve_memory
+            and isinstance(ic, ImageCollection)):
+        ic.load_func = _LRUCachedFunction(ic.load_func, cache_size)
+    return ic
 
 
 def imsave(fname, arr, plugin=None, check_contrast=True, **plugin_args):
@@ -138,8 +181,10 @@ def imsave(fname, arr, plugin=None, check_contrast=True, **plugin_args):
              'To silence this warning, please convert the image using '
              'img_as_ubyte.', stacklevel=2)
         arr = arr.astype('uint8') * 255
-    if check_contrast and is_low_contrast(arr):
-        warn(f'{fname} is a low contrast image')
+    if check_contrast:
+        from ..exposure import is_low_contrast
+        if is_low_contrast(arr):
+            warn(f'{fname} is a low contrast image')
     return call_plugin('imsave', fname, arr, plugin=plugin, **plugin_args)
 
 
@@ -1,7 +1,6 @@
 from collections import namedtuple
 import numpy as np
 from ...util import dtype as dtypes
-from ...exposure import is_low_contrast
 from ..._shared.utils import warn
 from math import floor, ceil
 
@@ -39,6 +38,9 @@ def _get_image_properties(image):
         - unsupported_dtype: if the image data type is not a
           standard skimage type, e.g. ``numpy.uint64``.
     """
+    # imported here, as the plugin is loaded by `import skimage.io`
+    from ...exposure import is_low_contrast
+
     immin, immax = np.min(image), np.max(image)
     imtype = image.dtype.type
     try:
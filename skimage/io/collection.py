@@ -373,6 +373,9 @@ class ImageCollection:
 
         """
         self.data = np.empty_like(self.data)
+        # images kept by a cached `load_func`, see `imread_collection`
+        if hasattr(self.load_func, 'cache_clear'):
+            self.load_func.cache_clear()
 
     def concatenate(self):
         """Concatenate all images in the collection into an array.
@@ -1,10 +1,11 @@
 import os
+import pickle
 
 import numpy as np
 import imageio
 from skimage import data_dir
 from skimage.io.collection import ImageCollection, MultiImage, alphanumeric_key
-from skimage.io import reset_plugins
+from skimage.io import imread, imread_collection, reset_plugins
 
 from skimage._shared import testing
 from skimage._shared.testing import assert_equal, assert_allclose, fetch
@@ -95,6 +96,28 @@ class TestImageCollection():
         assert_allclose(self.images[1], self.images[::-1][0])
         assert_allclose(self.images[0], self.images[::-1][1])
 
+    def test_imread_collection_cache_size(self):
+        pattern = self.pattern + [os.path.join(data_dir, 'rocket.jpg')]
+        images = imread_collection(pattern, cache_size=2)
+        assert images.conserve_memory
+        for n in [0, 1, 0, 1, 2, 0]:
+            assert_equal(images[n], imread(images.files[n]))
+        info = images.load_func.cache_info()
+        # images 0 and 1 are read once, then 0 is evicted by 2
+        assert (info.hits, info.misses, info.currsize) == (2, 4, 2)
+        images.reload()
+        assert images.load_func.cache_info().currsize == 0
+
+    def test_imread_collection_cache_size_pickle(self):
+        # the plugin's imread can be pickled, unlike the default imageio one
+        images = imread_collection(self.pattern, plugin='pil', cache_size=2)
+        expected = [images[0], images[1]]
+        unpickled = pickle.loads(pickle.dumps(images))
+        assert unpickled.load_func.cache_info().maxsize == 2
+        for img, expected_img in zip(unpickled, expected):
+            assert_equal(img, expected_img)
+        assert unpickled.load_func.cache_info().currsize == 2
+
     def test_files_property(self):
         assert isinstance(self.images.files, list)
 
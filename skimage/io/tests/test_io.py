@@ -1,5 +1,7 @@
 import os
 import pathlib
+import subprocess
+import sys
 import tempfile
 
 import numpy as np
@@ -38,6 +40,25 @@ def test_stack_non_array():
         io.push([[1, 2, 3]])
 
 
+def test_stack_size():
+    io.image_stack.clear()
+    images = [np.full((2, 2), i) for i in range(5)]
+    try:
+        io.set_stack_size(3)
+        for img in images:
+            io.push(img)
+        assert len(io.image_stack) == 3
+        io.set_stack_size(2)
+        assert_array_equal(io.pop(), images[4])
+        assert_array_equal(io.pop(), images[3])
+        with pytest.raises(IndexError):
+            io.pop()
+        with pytest.raises(ValueError):
+            io.set_stack_size(0)
+    finally:
+        io.set_stack_size(16)
+
+
 def test_imread_file_url():
     # tweak data path so that file URI works on both unix and windows.
     data_path = str(fetch('data/camera.png'))
@@ -118,3 +139,13 @@ def test_failed_temporary_file(monkeypatch, error_class):
         )
         with pytest.raises(error_class):
             io.imread(image_url)
+
+
+def test_import_io_does_not_import_color():
+    # skimage.color and skimage.exposure are only imported when needed
+    code = ("import sys, skimage.io; "
+            "print('skimage.color' in sys.modules, "
+            "'skimage.exposure' in sys.modules)")
+    result = subprocess.run([sys.executable, '-c', code],
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ['False', 'False']
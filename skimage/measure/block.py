@@ -2,6 +2,36 @@ import numpy as np
 from ..util import view_as_blocks
 
 
+# Reductions of `block_reduce` computed by combining the strided slices of
+# the image with a ufunc, see `_reduce_blocks`.
+_UFUNC_REDUCTIONS = ((np.sum, np.add), (np.mean, np.add),
+                     (np.min, np.minimum), (np.max, np.maximum))
+
+
+def _reduce_blocks(image, block_size, ufunc, dtype):
+    """Reduce the blocks of `image` with `ufunc`, accumulating in `dtype`.
+
+    The shape of `image` must be a multiple of `block_size`. The blocks are
+    reduced one axis at a time, by combining the strided slices of the axis
+    element-wise. This is much faster than reducing the (small) trailing
+    axes of a block view of the image.
+    """
+    out = image
+    for axis, size in enumerate(block_size):
+        if size == 1:
+            continue
+        sl = [slice(None)] * image.ndim
+        sl[axis] = slice(0, None, size)
+        acc = out[tuple(sl)].astype(dtype)
+        for i in range(1, size):
+            sl[axis] = slice(i, None, size)
+            ufunc(acc, out[tuple(sl)], out=acc)
+        out = acc
+    if out is image:
+        out = image.astype(dtype)
+    return out
+
+
 def block_reduce(image, block_size=2, func=np.sum, cval=0, func_kwargs=None):
     """Downsample image by applying function `func` to local blocks.
 
@@ -81,8 +111,26 @@ def block_reduce(image, block_size=2, func=np.sum, cval=0, func_kwargs=None):
             after_width = 0
         pad_width.append((0, after_width))
 
-    image = np.pad(image, pad_width=pad_width, mode='constant',
-                   constant_values=cval)
+    if any(after_width for _, after_width in pad_width):
+        image = np.pad(image, pad_width=pad_width, mode='constant',
+                       constant_values=cval)
+
+    ufunc = None
+    if not func_kwargs and image.dtype.kind in 'biuf':
+        ufunc = next((u for f, u in _UFUNC_REDUCTIONS if func is f), None)
+    if ufunc is not None:
+        if func is np.mean:
+            out_dtype = image.dtype if image.dtype.kind == 'f' else np.float64
+            # like np.mean, use float32 intermediates for float16
+            dtype = np.promote_types(out_dtype, np.float32)
+            out = _reduce_blocks(image, block_size, ufunc, dtype)
+            out /= np.prod(block_size)
+            return out.astype(out_dtype, copy=False)
+        if func is np.sum:
+            dtype = np.sum(np.zeros(1, dtype=image.dtype)).dtype
+        else:
+            dtype = image.dtype
+        return _reduce_blocks(image, block_size, ufunc, dtype)
 
     blocked = view_as_blocks(image, block_size)
 
@@ -1,4 +1,7 @@
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from warnings import warn
 
 import numpy as np
@@ -622,10 +625,46 @@ def _dynamic_max_trials(n_inliers, n_samples, min_samples, probability):
     return np.ceil(np.log(nom) / np.log(denom))
 
 
+def _random_subsets(random_state, num_samples, min_samples, block_size=64):
+    """Generate random subsets of distinct sample indices.
+
+    The indices are drawn for `block_size` subsets at a time with a single
+    call to the random generator. The few subsets that contain repeated
+    indices are redrawn without replacement.
+
+    Parameters
+    ----------
+    random_state : `numpy.random.Generator`
+        Random generator used to draw the indices.
+    num_samples : int
+        Total number of samples in the data.
+    min_samples : int
+        Number of distinct samples in each subset.
+    block_size : int, optional
+        Number of subsets drawn at once.
+
+    Yields
+    ------
+    spl_idxs : (min_samples,) array of int
+        Indices of the samples in the subset.
+    """
+    while True:
+        block = random_state.integers(num_samples,
+                                      size=(block_size, min_samples))
+        sorted_block = np.sort(block, axis=1)
+        has_duplicates = np.any(sorted_block[:, 1:] == sorted_block[:, :-1],
+                                axis=1)
+        for i in np.flatnonzero(has_duplicates):
+            block[i] = random_state.choice(num_samples, min_samples,
+                                           replace=False)
+        yield from block
+
+
 def ransac(data, model_class, min_samples, residual_threshold,
            is_data_valid=None, is_model_valid=None,
            max_trials=100, stop_sample_num=np.inf, stop_residuals_sum=0,
-           stop_probability=1, random_state=None, initial_inliers=None):
+           stop_probability=1, random_state=None, initial_inliers=None,
+           num_workers=1):
     """Fit a model to data with the RANSAC (random sample consensus) algorithm.
 
     RANSAC is an iterative algorithm for the robust estimation of parameters
@@ -707,6 +746,15 @@ def ransac(data, model_class, min_samples, residual_threshold,
         instance is used.
     initial_inliers : array-like of bool, shape (N,), optional
         Initial samples selection for model estimation
+    num_workers : int or None, optional
+        The number of parallel threads used to evaluate the random trials.
+        If set to ``None``, the full set of available cores are used. The
+        trials are still scored in the order in which they are drawn, so the
+        result does not depend on `num_workers`. With more than one thread,
+        the methods of `model_class`, `is_data_valid` and `is_model_valid`
+        must be thread-safe.
+
+        .. versionadded:: 0.21
 
 
     Returns
@@ -826,68 +874,98 @@ def ransac(data, model_class, min_samples, residual_threshold,
             f"True (this sample is an initial inlier) and False (this one "
             f"isn't) values.")
 
-    # for the first run use initial guess of inliers
-    spl_idxs = (initial_inliers if initial_inliers is not None
-                else random_state.choice(num_samples, min_samples,
-                                         replace=False))
-
-    # estimate model for current random sample set
-    model = model_class()
-
-    num_trials = 0
-    # max_trials can be updated inside the loop, so this cannot be a for-loop
-    while num_trials < max_trials:
-        num_trials += 1
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    if num_workers < 1:
+        raise ValueError("`num_workers` must be greater than zero")
 
+    def _trial(spl_idxs):
+        """Fit a model to a random subset of the data and score it."""
         # do sample selection according data pairs
         samples = [d[spl_idxs] for d in data]
 
-        # for next iteration choose random sample set and be sure that
-        # no samples repeat
-        spl_idxs = random_state.choice(num_samples, min_samples, replace=False)
-
         # optional check if random sample set is valid
         if validate_data and not is_data_valid(*samples):
-            continue
+            return None
 
+        # estimate model for current random sample set
+        model = model_class()
         success = model.estimate(*samples)
         # backwards compatibility
         if success is not None and not success:
-            continue
+            return None
 
         # optional check if estimated model is valid
         if validate_model and not is_model_valid(model, *samples):
-            continue
+            return None
 
         residuals = np.abs(model.residuals(*data))
         # consensus set / inliers
         inliers = residuals < residual_threshold
         residuals_sum = residuals.dot(residuals)
+        return inliers, residuals_sum
 
-        # choose as new best model if number of inliers is maximal
-        inliers_count = np.count_nonzero(inliers)
-        if (
-            # more inliers
-            inliers_count > best_inlier_num
-            # same number of inliers but less "error" in terms of residuals
-            or (inliers_count == best_inlier_num
-                and residuals_sum < best_inlier_residuals_sum)):
-            best_inlier_num = inliers_count
-            best_inlier_residuals_sum = residuals_sum
-            best_inliers = inliers
-            max_trials = min(max_trials,
-                             _dynamic_max_trials(best_inlier_num,
-                                                 num_samples,
-                                                 min_samples,
-                                                 stop_probability))
-            if (best_inlier_num >= stop_sample_num
-                    or best_inlier_residuals_sum <= stop_residuals_sum):
-                break
+    subsets = _random_subsets(random_state, num_samples, min_samples)
+
+    # for the first run use initial guess of inliers
+    spl_idxs = (initial_inliers if initial_inliers is not None
+                else next(subsets))
+
+    num_trials = 0
+    stop = False
+    pool = (ThreadPoolExecutor(max_workers=num_workers) if num_workers > 1
+            else nullcontext())
+    with pool:
+        map_trials = pool.map if num_workers > 1 else map
+        # max_trials can be updated inside the loop, so this cannot be a
+        # for-loop
+        while not stop and num_trials < max_trials:
+            # evaluate up to one trial per thread at a time
+            batch = []
+            for _ in range(int(min(num_workers, max_trials - num_trials))):
+                batch.append(spl_idxs)
+                # for next iteration choose random sample set and be sure
+                # that no samples repeat
+                spl_idxs = next(subsets)
+
+            for result in map_trials(_trial, batch):
+                num_trials += 1
+                if result is not None:
+                    inliers, residuals_sum = result
+
+                    # choose as new best model if number of inliers is
+                    # maximal
+                    inliers_count = np.count_nonzero(inliers)
+                    if (
+                        # more inliers
+                        inliers_count > best_inlier_num
+                        # same number of inliers but less "error" in terms
+                        # of residuals
+                        or (inliers_count == best_inlier_num
+                            and residuals_sum < best_inlier_residuals_sum)):
+                        best_inlier_num = inliers_count
+                        best_inlier_residuals_sum = residuals_sum
+                        best_inliers = inliers
+                        max_trials = min(max_trials,
+                                         _dynamic_max_trials(best_inlier_num,
+                                                             num_samples,
+                                                             min_samples,
+                                                             stop_probability))
+                        if (best_inlier_num >= stop_sample_num
+                                or best_inlier_residuals_sum
+                                <= stop_residuals_sum):
+                            stop = True
+
+                # the remaining trials of the batch would not have been run
+                # serially
+                if stop or num_trials >= max_trials:
+                    break
 
     # estimate final model using all inliers
-    if any(best_inliers):
+    if np.any(best_inliers):
         # select inliers for each data array
         data_inliers = [d[best_inliers] for d in data]
+        model = model_class()
         model.estimate(*data_inliers)
         if validate_model and not is_model_valid(model, *data_inliers):
             warn("Estimated model is not valid. Try increasing max_trials.")
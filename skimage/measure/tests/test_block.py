@@ -2,7 +2,7 @@ import numpy as np
 from skimage.measure import block_reduce
 
 from skimage._shared import testing
-from skimage._shared.testing import assert_equal
+from skimage._shared.testing import assert_allclose, assert_equal
 
 
 def test_block_reduce_sum():
@@ -133,3 +133,22 @@ def test_func_kwargs_different_dtype():
 
     assert_equal(out, expected)
     assert out.dtype == expected.dtype
+
+
+@testing.parametrize('func', [np.sum, np.mean, np.min, np.max])
+@testing.parametrize('dtype', [bool, np.uint8, np.int64, np.float16,
+                               np.float32, np.float64])
+@testing.parametrize('shape, block_size', [((6, 8), (2, 4)),
+                                           ((7, 9), (2, 3)),
+                                           ((5, 6, 7), (2, 1, 3)),
+                                           ((4, 4), (1, 1))])
+def test_ufunc_reductions(func, dtype, shape, block_size):
+    # the common reductions are computed specifically, and must match
+    # their result on the blocks given to other functions
+    rng = np.random.default_rng(0)
+    image = (rng.random(shape) * 100).astype(dtype)
+    out = block_reduce(image, block_size, func=func, cval=1)
+    expected = block_reduce(image, block_size, cval=1,
+                            func=lambda x, axis: func(x, axis=axis))
+    assert out.dtype == expected.dtype
+    assert_allclose(out, expected, rtol=1e-3)
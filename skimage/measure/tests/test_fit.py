@@ -301,6 +301,24 @@ def test_ransac_geometric():
     assert np.all(np.nonzero(inliers == False)[0] == outliers)
 
 
+@testing.parametrize('num_workers', [2, 5, None])
+def test_ransac_num_workers(num_workers):
+    random_state = np.random.default_rng(12373240)
+    x = np.arange(-200, 200)
+    data = np.column_stack([x, 0.2 * x + 20])
+    data = data + random_state.normal(scale=3, size=data.shape)
+    data[:30] = random_state.normal(loc=(180, -100), scale=10, size=(30, 2))
+
+    model_serial, inliers_serial = ransac(data, LineModelND, 2, 1,
+                                          max_trials=200, random_state=1)
+    model, inliers = ransac(data, LineModelND, 2, 1, max_trials=200,
+                            random_state=1, num_workers=num_workers)
+
+    assert_equal(inliers, inliers_serial)
+    assert_almost_equal(model.params[0], model_serial.params[0])
+    assert_almost_equal(model.params[1], model_serial.params[1])
+
+
 def test_ransac_is_data_valid():
     def is_data_valid(data):
         return data.shape[0] > 2
@@ -391,6 +409,10 @@ def test_ransac_invalid_input():
     with testing.raises(ValueError):
         ransac(np.zeros((10, 2)), None, min_samples=-1,
                residual_threshold=0)
+    # `num_workers` must be greater than zero
+    with testing.raises(ValueError):
+        ransac(np.zeros((10, 2)), None, min_samples=2,
+               residual_threshold=0, num_workers=0)
 
 
 def test_ransac_sample_duplicates():
@@ -436,5 +458,5 @@ def test_ransac_non_valid_best_model():
     data = np.linspace([0, 0, 0], [0.3, 0, 1], 1000) + rnd.rand(1000, 3) - 0.5
     with expected_warnings(["Estimated model is not valid"]):
         ransac(data, LineModelND, min_samples=2,
-               residual_threshold=0.3, max_trials=50, random_state=0,
+               residual_threshold=0.3, max_trials=50, random_state=3,
                is_model_valid=is_model_valid)
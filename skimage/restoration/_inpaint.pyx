@@ -1,8 +1,30 @@
 import cython
+from cython.parallel cimport prange
+
+cimport numpy as cnp
+import numpy as np
 
 from .._shared.fused_numerics cimport np_floats
 
 
+ctypedef fused index_t:
+    cnp.int32_t
+    cnp.int64_t
+
+
+cdef extern from *:
+    """
+    #ifdef _OPENMP
+    #define SKIMAGE_INPAINT_OPENMP 1
+    #else
+    #define SKIMAGE_INPAINT_OPENMP 0
+    #endif
+    """
+    # whether the extension is compiled with OpenMP, i.e. prange runs
+    # in parallel
+    bint SKIMAGE_INPAINT_OPENMP
+
+
 @cython.boundscheck(False)  # Deactivate bounds checking
 @cython.wraparound(False)   # Deactivate negative indexing.
 @cython.cdivision(True)  # C style integer division
@@ -18,42 +40,91 @@ cpdef Py_ssize_t _build_matrix_inner(
     char[::1] mask_flat,
     np_floats[:, ::1] out_flat,
     # output arrays
-    Py_ssize_t[::1] row_idx_known,
+    index_t[::1] row_idx_known,
     np_floats[:, ::1] data_known,
-    Py_ssize_t[::1] row_idx_unknown,
-    Py_ssize_t[::1] col_idx_unknown,
+    index_t[::1] row_idx_unknown,
+    index_t[::1] col_idx_unknown,
     np_floats[::1] data_unknown
 ):
-    """Fill values in *_known and *_unkown"""
+    """Fill values in *_known and *_unkown
+
+    When compiled with OpenMP, the points are processed in parallel. A first
+    pass counts the unknown values around each point, from which the
+    position of the values of each point in the output arrays is known for
+    the second pass. Otherwise, the values are filled in a single sequential
+    pass, as the counting pass would only add to its cost.
+
+    The indices are written as 32-bit integers when the arrays of indices
+    are, which the caller can choose when there are fewer than 2**31 pixels.
+    """
     cdef:
         Py_ssize_t i, o, ch
-        Py_ssize_t row_idx, known_idx, unknown_idx, loc, n_known
+        Py_ssize_t known_idx, unknown_idx, loc, n_unknown, n_known
         Py_ssize_t num_offsets = len(raveled_offsets)
         Py_ssize_t npix = len(center_i)
 
         np_floats cval
         int nchannels = data_known.shape[1]
 
-    row_idx = row_start
-    known_idx = known_start_idx
-    unknown_idx = unknown_start_idx
-
-    for i in range(npix):
-        n_known = 0
-        for o in range(num_offsets):
-            loc = center_i[i] + raveled_offsets[o]
-            cval = coef_vals[o]
-            if mask_flat[loc]:
-                data_unknown[unknown_idx] = cval
-                row_idx_unknown[unknown_idx] = row_idx
-                col_idx_unknown[unknown_idx] = loc
-                unknown_idx += 1
-            else:
-                for ch in range(nchannels):
-                    data_known[known_idx, ch] -= cval * out_flat[loc, ch]
-                n_known += 1
-        if n_known > 0:
-            row_idx_known[known_idx] = row_idx
-            known_idx += 1
-        row_idx += 1
-    return known_idx
+        # start index of the values of each point in the output arrays
+        Py_ssize_t[::1] known_start, unknown_start
+
+    if not SKIMAGE_INPAINT_OPENMP:
+        known_idx = known_start_idx
+        unknown_idx = unknown_start_idx
+        with nogil:
+            for i in range(npix):
+                n_known = 0
+                for o in range(num_offsets):
+                    loc = center_i[i] + raveled_offsets[o]
+                    cval = coef_vals[o]
+                    if mask_flat[loc]:
+                        data_unknown[unknown_idx] = cval
+                        row_idx_unknown[unknown_idx] = row_start + i
+                        col_idx_unknown[unknown_idx] = loc
+                        unknown_idx += 1
+                    else:
+                        for ch in range(nchannels):
+                            data_known[known_idx, ch] -= (
+                                cval * out_flat[loc, ch]
+                            )
+                        n_known += 1
+                if n_known > 0:
+                    row_idx_known[known_idx] = row_start + i
+                    known_idx += 1
+        return known_idx
+
+    known_start = np.empty(npix + 1, dtype=np.intp)
+    unknown_start = np.empty(npix + 1, dtype=np.intp)
+    with nogil:
+        for i in prange(npix):
+            n_unknown = 0
+            for o in range(num_offsets):
+                if mask_flat[center_i[i] + raveled_offsets[o]]:
+                    n_unknown = n_unknown + 1
+            unknown_start[i + 1] = n_unknown
+
+        known_start[0] = known_start_idx
+        unknown_start[0] = unknown_start_idx
+        for o in range(npix):
+            known_start[o + 1] = (known_start[o]
+                                  + (unknown_start[o + 1] < num_offsets))
+            unknown_start[o + 1] += unknown_start[o]
+
+        for i in prange(npix):
+            known_idx = known_start[i]
+            unknown_idx = unknown_start[i]
+            for o in range(num_offsets):
+                loc = center_i[i] + raveled_offsets[o]
+                cval = coef_vals[o]
+                if mask_flat[loc]:
+                    data_unknown[unknown_idx] = cval
+                    row_idx_unknown[unknown_idx] = row_start + i
+                    col_idx_unknown[unknown_idx] = loc
+                    unknown_idx = unknown_idx + 1
+                else:
+                    for ch in range(nchannels):
+                        data_known[known_idx, ch] -= cval * out_flat[loc, ch]
+            if known_start[i + 1] > known_idx:
+                row_idx_known[known_idx] = row_start + i
+    return known_start[npix]
@@ -10,12 +10,6 @@ from ..measure import label
 from ._inpaint import _build_matrix_inner
 
 
-def _get_neighborhood(nd_idx, radius, nd_shape):
-    bounds_lo = np.maximum(nd_idx - radius, 0)
-    bounds_hi = np.minimum(nd_idx + radius + 1, nd_shape)
-    return bounds_lo, bounds_hi
-
-
 def _get_neigh_coef(shape, center, dtype=float):
     # Create biharmonic coefficients ndarray
     neigh_coef = np.zeros(shape, dtype=dtype)
@@ -30,125 +24,132 @@ def _get_neigh_coef(shape, center, dtype=float):
     return neigh_coef, coef_idx, coef_vals
 
 
-def _inpaint_biharmonic_single_region(image, mask, out, neigh_coef_full,
-                                      coef_vals, raveled_offsets):
-    """Solve a (sparse) linear system corresponding to biharmonic inpainting.
-
-    This function creates a linear system of the form:
-
-    ``A @ u = b``
-
-    where ``A`` is a sparse matrix, ``b`` is a vector enforcing smoothness and
-    boundary constraints and ``u`` is the vector of inpainted values to be
-    (uniquely) determined by solving the linear system.
+def _build_system(mask, out, neigh_coef_full, coef_vals, offsets,
+                  coef_cache):
+    """Build the sparse linear system of the biharmonic inpainting of a region.
 
-    ``A`` is a sparse matrix of shape (n_mask, n_mask) where `n_mask``
-    corresponds to the number of non-zero values in ``mask`` (i.e. the number
-    of pixels to be inpainted). Each row in A will have a number of non-zero
-    values equal to the number of non-zero values in the biharmonic kernel,
-    ``neigh_coef_full``. In practice, biharmonic kernels with reduced extent
-    are used at the image borders. This matrix, ``A`` is the same for all
-    image channels (since the same inpainting mask is currently used for all
-    channels).
+    See `_inpaint_biharmonic_single_region` for a description of the system
+    and of the parameters. The matrix only depends on ``mask``, so it is built
+    once for all the channels of ``out``, which only enter the right hand side.
 
-    ``u`` is a dense matrix of shape ``(n_mask, n_channels)`` and represents
-    the vector of unknown values for each channel.
-
-    ``b`` is a dense matrix of shape ``(n_mask, n_channels)`` and represents
-    the desired output of convolving the solution with the biharmonic kernel.
-    At mask locations where there is no overlap with known values, ``b`` will
-    have a value of 0. This enforces the biharmonic smoothness constraint in
-    the interior of inpainting regions. For regions near the boundary that
-    overlap with known values, the entries in ``b`` enforce boundary conditions
-    designed to avoid discontinuity with the known values.
+    Returns
+    -------
+    matrix_unknown : scipy.sparse.csr_matrix
+        The matrix ``A``, of shape (n_mask, n_mask).
+    rhs : ndarray
+        The right hand side ``b``, of shape (n_mask, n_channels).
+    mask_i : ndarray
+        Raveled indices into ``mask`` of the unknowns, in the order of the
+        rows (and columns) of ``A``.
     """
-
     n_channels = out.shape[-1]
     radius = neigh_coef_full.shape[0] // 2
 
-    edge_mask = np.ones(mask.shape, dtype=bool)
-    edge_mask[(slice(radius, -radius),) * mask.ndim] = 0
-    boundary_mask = edge_mask * mask
-    center_mask = ~edge_mask * mask
-
-    boundary_pts = np.where(boundary_mask)
-    boundary_i = np.flatnonzero(boundary_mask)
-    center_i = np.flatnonzero(center_mask)
+    # Single scan of the mask; the masked points closer than `radius` to an
+    # edge of the image (boundary points) are ordered first.
+    mask_flat = mask.reshape(-1)
+    mask_i = np.flatnonzero(mask_flat)
+    n_mask = mask_i.size
+    if n_mask == 0:
+        # nothing to inpaint
+        return (sparse.csr_matrix((0, 0), dtype=out.dtype),
+                np.zeros((0, n_channels), dtype=out.dtype), mask_i)
+    mask_pts = np.stack(np.unravel_index(mask_i, mask.shape), axis=1)
+    shape = np.asarray(mask.shape)
+    on_boundary = np.any((mask_pts < radius) | (mask_pts >= shape - radius),
+                         axis=1)
+    boundary_pts = mask_pts[on_boundary]
+    boundary_i = mask_i[on_boundary]
+    center_i = mask_i[~on_boundary]
     mask_i = np.concatenate((boundary_i, center_i))
 
-    center_pts = np.where(center_mask)
-    mask_pts = tuple(
-        [np.concatenate((b, c)) for b, c in zip(boundary_pts, center_pts)]
-    )
-
     # Use convolution to predetermine the number of non-zero entries in the
     # sparse system matrix.
     structure = neigh_coef_full != 0
     tmp = ndi.convolve(mask, structure, output=np.uint8, mode='constant')
-    nnz_matrix = tmp[mask].sum()
+    tmp = tmp.reshape(-1)[mask_i]
+    nnz_matrix = tmp.sum()
 
     # Need to estimate the number of zeros for the right hand side vector.
     # The computation below will slightly overestimate the true number of zeros
     # due to edge effects (the kernel itself gets shrunk in size near the
     # edges, but that isn't accounted for here). We can trim any excess entries
     # later.
-    n_mask = np.count_nonzero(mask)
     n_struct = np.count_nonzero(structure)
     nnz_rhs_vector_max = n_mask - np.count_nonzero(tmp == n_struct)
 
-    # pre-allocate arrays storing sparse matrix indices and values
-    row_idx_known = np.empty(nnz_rhs_vector_max, dtype=np.intp)
+    # pre-allocate arrays storing sparse matrix indices and values; 32-bit
+    # indices halve their size and are used as is by scipy.sparse
+    index_dtype = np.int32 if mask.size < 2**31 else np.int64
+    row_idx_known = np.empty(nnz_rhs_vector_max, dtype=index_dtype)
     data_known = np.zeros((nnz_rhs_vector_max, n_channels), dtype=out.dtype)
-    row_idx_unknown = np.empty(nnz_matrix, dtype=np.intp)
-    col_idx_unknown = np.empty(nnz_matrix, dtype=np.intp)
+    row_idx_unknown = np.empty(nnz_matrix, dtype=index_dtype)
+    col_idx_unknown = np.empty(nnz_matrix, dtype=index_dtype)
     data_unknown = np.empty(nnz_matrix, dtype=out.dtype)
 
-    # cache the various small, non-square Laplacians used near the boundary
-    coef_cache = {}
-
-    # Iterate over masked points near the boundary
-    mask_flat = mask.reshape(-1)
-    out_flat = np.ascontiguousarray(out.reshape((-1, n_channels)))
-    idx_known = 0
+    # view of the (C-contiguous) output, through which the result is written
+    out_flat = out.reshape((-1, n_channels))
+
+    # Masked points near the boundary use truncated biharmonic kernels that
+    # only depend on the distance (up to `radius`) of the point to the low and
+    # high edges along each axis. The points are grouped by these distances,
+    # so that each kernel is computed once and applied to its whole group.
+    n_boundary = boundary_pts.shape[0]
+    dist_lo = np.minimum(boundary_pts, radius)
+    dist_hi = np.minimum(shape - 1 - boundary_pts, radius)
+    groups, group_idx, group_sizes = np.unique(
+        np.concatenate((dist_lo, dist_hi), axis=1), axis=0,
+        return_inverse=True, return_counts=True
+    )
+    # rows (in increasing order) of the points of each group
+    group_rows = np.split(np.argsort(group_idx.reshape(-1), kind='stable'),
+                          np.cumsum(group_sizes)[:-1])
+    # strides (in elements) of the raveled mask
+    ravel_strides = np.cumprod((1,) + mask.shape[:0:-1])[::-1].astype(np.intp)
+
+    data_boundary = np.zeros((n_boundary, n_channels), dtype=out.dtype)
+    has_known = np.zeros(n_boundary, dtype=bool)
     idx_unknown = 0
-    mask_pt_n = -1
-    boundary_pts = np.stack(boundary_pts, axis=1)
-    for mask_pt_n, nd_idx in enumerate(boundary_pts):
-        # Get bounded neighborhood of selected radius
-        b_lo, b_hi = _get_neighborhood(nd_idx, radius, mask.shape)
-
+    for lo, hi, rows in zip(groups[:, :mask.ndim], groups[:, mask.ndim:],
+                            group_rows):
         # Create (truncated) biharmonic coefficients ndarray
-        coef_shape = tuple(b_hi - b_lo)
-        coef_center = tuple(nd_idx - b_lo)
-        coef_idx, coefs = coef_cache.get((coef_shape, coef_center),
-                                         (None, None))
-        if coef_idx is None:
-            _ , coef_idx, coefs = _get_neigh_coef(coef_shape,
-                                                  coef_center,
-                                                  dtype=out.dtype)
-            coef_cache[(coef_shape, coef_center)] = (coef_idx, coefs)
-
-        # compute corresponding 1d indices into the mask
-        coef_idx = coef_idx + b_lo[:, np.newaxis]
-        index1d = np.ravel_multi_index(coef_idx, mask.shape)
-
-        # Iterate over masked point's neighborhood
-        nvals = 0
-        for coef, i in zip(coefs, index1d):
-            if mask_flat[i]:
-                row_idx_unknown[idx_unknown] = mask_pt_n
-                col_idx_unknown[idx_unknown] = i
-                data_unknown[idx_unknown] = coef
-                idx_unknown += 1
-            else:
-                data_known[idx_known, :] -= coef * out_flat[i, :]
-                nvals += 1
-        if nvals:
-            row_idx_known[idx_known] = mask_pt_n
-            idx_known += 1
-
-    # Call an efficient Cython-based implementation for all interior points
-    row_start = mask_pt_n + 1
+        key = (tuple(lo), tuple(hi))
+        if key not in coef_cache:
+            _, coef_idx, coefs = _get_neigh_coef(tuple(lo + hi + 1),
+                                                 tuple(lo), dtype=out.dtype)
+            coef_cache[key] = (coef_idx, coefs)
+        coef_idx, coefs = coef_cache[key]
+        group_offsets = ravel_strides @ (coef_idx - lo[:, np.newaxis])
+
+        # 1d indices into the mask of the neighborhood of each point
+        index1d = boundary_i[rows, np.newaxis] + group_offsets
+        unknown = mask_flat[index1d]
+
+        n_unknown = np.count_nonzero(unknown)
+        unknown_sl = slice(idx_unknown, idx_unknown + n_unknown)
+        row_idx_unknown[unknown_sl] = np.broadcast_to(rows[:, np.newaxis],
+                                                      unknown.shape)[unknown]
+        col_idx_unknown[unknown_sl] = index1d[unknown]
+        data_unknown[unknown_sl] = np.broadcast_to(coefs,
+                                                   unknown.shape)[unknown]
+        idx_unknown += n_unknown
+
+        # weighted sum of the known values, as a single contraction over the
+        # kernel (masked neighbors, which may hold any value, are zeroed)
+        vals = out_flat[index1d]
+        vals[unknown] = 0
+        data_boundary[rows] = -np.einsum('k,nkc->nc', coefs, vals)
+        has_known[rows] = ~np.all(unknown, axis=1)
+
+    row_idx_boundary = np.flatnonzero(has_known)
+    idx_known = row_idx_boundary.size
+    row_idx_known[:idx_known] = row_idx_boundary
+    data_known[:idx_known] = data_boundary[has_known]
+
+    # Call an efficient Cython-based implementation for all interior points,
+    # with the raveled offsets of the full kernel
+    raveled_offsets = ravel_strides @ offsets
+    row_start = n_boundary
     known_start_idx = idx_known
     unknown_start_idx = idx_unknown
     nnz_rhs = _build_matrix_inner(
@@ -166,26 +167,80 @@ def _inpaint_biharmonic_single_region(image, mask, out, neigh_coef_full,
     row_idx_known = row_idx_known[:nnz_rhs]
     data_known = data_known[:nnz_rhs, :]
 
-    # Form sparse matrix of unknown values
-    sp_shape = (n_mask, out.size)
+    # Form the (square) sparse matrix of unknown values, whose columns follow
+    # the order of the masked points in `mask_i`
+    mask_col = np.empty(mask.size, dtype=index_dtype)
+    mask_col[mask_i] = np.arange(n_mask, dtype=index_dtype)
     matrix_unknown = sparse.coo_matrix(
-        (data_unknown, (row_idx_unknown, col_idx_unknown)), shape=sp_shape
+        (data_unknown, (row_idx_unknown, mask_col[col_idx_unknown])),
+        shape=(n_mask, n_mask)
     ).tocsr()
 
-    # Solve linear system for masked points
-    matrix_unknown = matrix_unknown[:, mask_i]
-
     # dense vectors representing the right hand side for each channel
     rhs = np.zeros((n_mask, n_channels), dtype=out.dtype)
     rhs[row_idx_known, :] = data_known
+    return matrix_unknown, rhs, mask_i
 
-    # set use_umfpack to False so float32 data is supported
+
+def _inpaint_biharmonic_single_region(image, mask, out, neigh_coef_full,
+                                      coef_vals, offsets, coef_cache):
+    """Solve a (sparse) linear system corresponding to biharmonic inpainting.
+
+    This function creates a linear system of the form:
+
+    ``A @ u = b``
+
+    where ``A`` is a sparse matrix, ``b`` is a vector enforcing smoothness and
+    boundary constraints and ``u`` is the vector of inpainted values to be
+    (uniquely) determined by solving the linear system.
+
+    ``A`` is a sparse matrix of shape (n_mask, n_mask) where `n_mask``
+    corresponds to the number of non-zero values in ``mask`` (i.e. the number
+    of pixels to be inpainted). Each row in A will have a number of non-zero
+    values equal to the number of non-zero values in the biharmonic kernel,
+    ``neigh_coef_full``. In practice, biharmonic kernels with reduced extent
+    are used at the image borders. This matrix, ``A`` is the same for all
+    image channels (since the same inpainting mask is currently used for all
+    channels).
+
+    ``u`` is a dense matrix of shape ``(n_mask, n_channels)`` and represents
+    the vector of unknown values for each channel.
+
+    ``b`` is a dense matrix of shape ``(n_mask, n_channels)`` and represents
+    the desired output of convolving the solution with the biharmonic kernel.
+    At mask locations where there is no overlap with known values, ``b`` will
+    have a value of 0. This enforces the biharmonic smoothness constraint in
+    the interior of inpainting regions. For regions near the boundary that
+    overlap with known values, the entries in ``b`` enforce boundary conditions
+    designed to avoid discontinuity with the known values.
+
+    ``coef_cache`` is a dictionary of the truncated biharmonic kernels used
+    near the image borders, shared by all the inpainted regions. It maps
+    the distances of a point to the low and high edges of ``mask`` along each
+    axis (up to the kernel radius) to the kernel indices and values.
+
+    ``offsets`` holds the offsets along each axis of the non-zero
+    coefficients of the full biharmonic kernel from its center, which are
+    raveled with the strides of ``mask``.
+
+    ``out`` has to be C-contiguous, as the inpainted values are written in
+    place through a flat view of it.
+    """
+
+    matrix_unknown, rhs, mask_i = _build_system(
+        mask, out, neigh_coef_full, coef_vals, offsets, coef_cache
+    )
+    if mask_i.size == 0:
+        return out
+
+    # Solve linear system for masked points, factorizing the matrix once for
+    # all the channels. Set use_umfpack to False so float32 data is supported
     result = spsolve(matrix_unknown, rhs, use_umfpack=False,
                      permc_spec='MMD_ATA')
     if result.ndim == 1:
         result = result[:, np.newaxis]
 
-    out[mask_pts] = result
+    out.reshape((-1, out.shape[-1]))[mask_i] = result
     return out
 
 
@@ -262,6 +317,12 @@ def inpaint_biharmonic(image, mask, *,
         image = image[..., np.newaxis]
     out = np.copy(image, order='C')
 
+    if not mask.any():
+        # nothing to inpaint
+        if not multichannel:
+            out = out[..., 0]
+        return out
+
     # Create biharmonic coefficients ndarray
     radius = 2
     coef_shape = (2 * radius + 1,) * mask.ndim
@@ -269,9 +330,8 @@ def inpaint_biharmonic(image, mask, *,
     neigh_coef_full, coef_idx, coef_vals = _get_neigh_coef(coef_shape,
                                                            coef_center,
                                                            dtype=out.dtype)
-
-    # stride for the last spatial dimension
-    channel_stride_bytes = out.strides[-2]
+    # truncated kernels used near the borders, shared by all the regions
+    coef_cache = {}
 
     # offsets to all neighboring non-zero elements in the footprint
     offsets = coef_idx - radius
@@ -290,6 +350,9 @@ def inpaint_biharmonic(image, mask, *,
         bbox_slices = ndi.find_objects(mask_labeled)
 
         for idx_region, bb_slice in enumerate(bbox_slices, 1):
+            if bb_slice is None:
+                # no masked pixels left with this label
+                continue
             # expand object bounding boxes by the biharmonic kernel radius
             roi_sl = tuple(slice(max(sl.start - radius, 0),
                                  min(sl.stop + radius, size))
@@ -301,26 +364,15 @@ def inpaint_biharmonic(image, mask, *,
             # copy for contiguity and to account for possible ROI overlap
             otmp = out[roi_sl].copy()
 
-            # compute raveled offsets for the ROI
-            ostrides = np.array([s // channel_stride_bytes
-                                 for s in otmp[..., 0].strides])
-            raveled_offsets = np.sum(offsets * ostrides[..., np.newaxis],
-                                     axis=0)
-
             _inpaint_biharmonic_single_region(
                 image[roi_sl], mask_region, otmp,
-                neigh_coef_full, coef_vals, raveled_offsets
+                neigh_coef_full, coef_vals, offsets, coef_cache
             )
             # assign output to the
             out[roi_sl] = otmp
     else:
-        # compute raveled offsets for output image
-        ostrides = np.array([s // channel_stride_bytes
-                             for s in out[..., 0].strides])
-        raveled_offsets = np.sum(offsets * ostrides[..., np.newaxis], axis=0)
-
         _inpaint_biharmonic_single_region(
-            image, mask, out, neigh_coef_full, coef_vals, raveled_offsets
+            image, mask, out, neigh_coef_full, coef_vals, offsets, coef_cache
         )
 
     # Handle enormous values on a per-channel basis
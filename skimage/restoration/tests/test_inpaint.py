@@ -101,6 +101,20 @@ def test_inpaint_biharmonic_3d(split_into_regions):
     assert_allclose(ref, out)
 
 
+@testing.parametrize('channel_axis', [None, -1])
+@testing.parametrize('split_into_regions', [False, True])
+def test_inpaint_biharmonic_empty_mask(channel_axis, split_into_regions):
+    rng = np.random.default_rng(0)
+    shape = (10, 12) if channel_axis is None else (10, 12, 3)
+    img = rng.random(shape)
+    mask = np.zeros((10, 12), dtype=bool)
+    out = inpaint.inpaint_biharmonic(img, mask, channel_axis=channel_axis,
+                                     split_into_regions=split_into_regions)
+    assert out.shape == img.shape
+    assert out is not img
+    assert_allclose(out, img)
+
+
 def test_invalid_input():
     img, mask = np.zeros([]), np.zeros([])
     with testing.raises(ValueError):
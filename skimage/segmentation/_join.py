@@ -37,6 +37,17 @@ def join_segmentations(s1, s2):
     if s1.shape != s2.shape:
         raise ValueError("Cannot join segmentations of different shape. "
                          f"s1.shape: {s1.shape}, s2.shape: {s2.shape}")
+    # Each pair of labels is encoded as ``(s2.max() + 1) * s1 + s2``, which
+    # preserves the (lexicographic) order of the pairs, and then relabeled.
+    # The input labels need not be sequential for this, so they are only
+    # relabeled first when the code of the pairs would overflow otherwise.
+    dtype = np.result_type(s1, s2)
+    if dtype.kind in 'iu' and min(np.min(s1), np.min(s2)) >= 0:
+        s1_max = int(np.max(s1))
+        s2_max = int(np.max(s2))
+        if s1_max * (s2_max + 1) + s2_max <= np.iinfo(dtype).max:
+            j = (s2_max + 1) * s1.astype(dtype, copy=False) + s2
+            return relabel_sequential(j)[0]
     s1 = relabel_sequential(s1)[0]
     s2 = relabel_sequential(s2)[0]
     j = (s2.max() + 1) * s1 + s2
@@ -119,8 +130,22 @@ def relabel_sequential(label_field, offset=1):
         raise ValueError("Offset must be strictly positive.")
     if np.min(label_field) < 0:
         raise ValueError("Cannot relabel array that contains negative values.")
+    input_type = label_field.dtype
+    if input_type.kind not in "iu":
+        raise TypeError("label_field must have an integer dtype")
     offset = int(offset)
-    in_vals = np.unique(label_field)
+    # When the labels are no larger than the number of elements, counting
+    # them finds the present labels in linear time (instead of sorting), and
+    # the relabeling is done with a lookup table indexed by the labels.
+    max_label = int(np.max(label_field))
+    use_lut = max_label <= label_field.size
+    if use_lut:
+        label_counts = np.bincount(
+            label_field.reshape(-1).astype(np.intp, copy=False)
+        )
+        in_vals = np.flatnonzero(label_counts).astype(input_type)
+    else:
+        in_vals = np.unique(label_field)
     if in_vals[0] == 0:
         # always map 0 to 0
         out_vals = np.concatenate(
@@ -128,9 +153,6 @@ def relabel_sequential(label_field, offset=1):
         )
     else:
         out_vals = np.arange(offset, offset+len(in_vals))
-    input_type = label_field.dtype
-    if input_type.kind not in "iu":
-        raise TypeError("label_field must have an integer dtype")
 
     # Some logic to determine the output type:
     #  - we don't want to return a smaller output type than the input type,
@@ -149,9 +171,17 @@ def relabel_sequential(label_field, offset=1):
             output_type = input_type
         else:
             output_type = required_type
-    out_array = np.empty(label_field.shape, dtype=output_type)
     out_vals = out_vals.astype(output_type)
-    map_array(label_field, in_vals, out_vals, out=out_array)
+    if output_type == input_type and np.array_equal(in_vals, out_vals):
+        # the labels are already sequential
+        out_array = np.array(label_field)
+    elif use_lut:
+        lut = np.zeros(max_label + 1, dtype=output_type)
+        lut[in_vals] = out_vals
+        out_array = lut[label_field]
+    else:
+        out_array = np.empty(label_field.shape, dtype=output_type)
+        map_array(label_field, in_vals, out_vals, out=out_array)
     fw_map = ArrayMap(in_vals, out_vals)
     inv_map = ArrayMap(out_vals, in_vals)
     return out_array, fw_map, inv_map
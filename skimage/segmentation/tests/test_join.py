@@ -30,6 +30,23 @@ def test_join_segmentations():
         join_segmentations(s1, s3)
 
 
+@pytest.mark.parametrize("dtype1, dtype2", [(np.int64, np.int64),
+                                            (np.uint16, np.int8),
+                                            (np.uint8, np.uint8)])
+def test_join_segmentations_non_sequential(dtype1, dtype2):
+    s1 = np.array([[0, 0, 30, 30],
+                   [0, 200, 30, 30],
+                   [200, 200, 200, 30]], dtype=dtype1)
+    s2 = np.array([[0, 99, 99, 0],
+                   [0, 99, 99, 0],
+                   [0, 99, 99, 99]], dtype=dtype2)
+    j = join_segmentations(s1, s2)
+    j_ref = np.array([[0, 1, 3, 2],
+                      [0, 5, 3, 2],
+                      [4, 5, 5, 3]])
+    assert_array_equal(j, j_ref)
+
+
 def _check_maps(ar, ar_relab, fw, inv):
     assert_array_equal(fw[ar], ar_relab)
     assert_array_equal(inv[ar_relab], ar)
@@ -86,6 +103,34 @@ def test_relabel_sequential_offset5_with0():
     assert_array_equal(inv, inv_ref)
 
 
+@pytest.mark.parametrize('dtype', (np.uint8, np.int32, np.uint64))
+@pytest.mark.parametrize('offset', (1, 5))
+def test_relabel_sequential_dense_labels(dtype, offset):
+    # labels no larger than the number of pixels are relabeled with a
+    # lookup table
+    rng = np.random.default_rng(0)
+    ar = rng.choice([0, 3, 4, 10, 11, 50, 99], size=(10, 10)).astype(dtype)
+    ar_relab, fw, inv = relabel_sequential(ar, offset=offset)
+    _check_maps(ar, ar_relab, fw, inv)
+    _, ar_relab_ref = np.unique(ar, return_inverse=True)
+    ar_relab_ref = np.where(ar_relab_ref > 0, ar_relab_ref + offset - 1, 0)
+    assert_array_equal(ar_relab, ar_relab_ref.reshape(ar.shape))
+    assert ar_relab.dtype == fw.dtype == inv.dtype == dtype
+
+
+@pytest.mark.parametrize('labels, offset', (([0, 1, 2, 3], 1),
+                                            ([1, 2, 3], 1),
+                                            ([0, 5, 6, 7], 5)))
+def test_relabel_sequential_sequential_returns_copy(labels, offset):
+    ar = np.array(labels * 3, dtype=np.int16).reshape(3, -1)
+    ar_relab, fw, inv = relabel_sequential(ar, offset=offset)
+    _check_maps(ar, ar_relab, fw, inv)
+    assert_array_equal(ar_relab, ar)
+    assert ar_relab.dtype == ar.dtype
+    # the output is a new array
+    assert not np.shares_memory(ar_relab, ar)
+
+
 def test_relabel_sequential_dtype():
     ar = np.array([1, 1, 5, 5, 8, 99, 42, 0], dtype=np.uint8)
     ar_relab, fw, inv = relabel_sequential(ar, offset=5)
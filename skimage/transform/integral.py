@@ -39,9 +39,12 @@ def integral_image(image, *, dtype=None):
         # default to at least double precision cumsum for accuracy
         dtype = np.promote_types(image.dtype, np.float64)
 
-    S = image
-    for i in range(image.ndim):
-        S = S.cumsum(axis=i, dtype=dtype)
+    # The prefix sum along the contiguous last axis allocates the output.
+    # The remaining axes are then accumulated in place, which adds whole
+    # contiguous rows (or planes) together instead of striding through them.
+    S = image.cumsum(axis=-1, dtype=dtype)
+    for i in range(image.ndim - 1):
+        S.cumsum(axis=i, out=S)
     return S
 
 
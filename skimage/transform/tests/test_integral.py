@@ -34,6 +34,19 @@ def test_integral_image_validity(dtype, dtype_as_kwarg):
             assert_equal(out[-1, -1], y.sum())
 
 
+@pytest.mark.parametrize('shape', [(7,), (9, 8), (5, 6, 7)])
+@pytest.mark.parametrize('transpose', [False, True])
+def test_integral_image_nd(shape, transpose):
+    rstate = np.random.default_rng(1234)
+    y = rstate.integers(0, 255, size=shape, dtype=np.uint8)
+    if transpose:
+        y = y.T
+    expected = y.astype(np.int64)
+    for i in range(y.ndim):
+        expected = expected.cumsum(axis=i)
+    assert_equal(integral_image(y), expected)
+
+
 def test_integrate_basic():
     assert_equal(x[12:24, 10:20].sum(), integrate(s, (12, 10), (23, 19)))
     assert_equal(x[:20, :20].sum(), integrate(s, (0, 0), (19, 19)))
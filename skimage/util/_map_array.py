@@ -54,10 +54,40 @@ def map_array(input_arr, input_vals, output_vals, out=None):
     # ensure all arrays have matching types before sending to Cython
     input_vals = input_vals.astype(input_arr.dtype, copy=False)
     output_vals = output_vals.astype(out.dtype, copy=False)
-    _map_array(input_arr, out_view, input_vals, output_vals)
+    if _use_lookup_table(input_arr, input_vals, out.dtype):
+        # The last element of the table is 0, so that values larger than
+        # those of `input_vals` are clipped to it, like missing values.
+        lut = np.zeros(int(np.max(input_vals)) + 2, dtype=out.dtype)
+        lut[input_vals] = output_vals
+        np.take(lut, input_arr, out=out_view, mode='clip')
+    else:
+        _map_array(input_arr, out_view, input_vals, output_vals)
     return out
 
 
+# maximum size (in bytes) of the lookup table used by `map_array`
+_MAX_LUT_BYTES = 64 * 2**20
+
+
+def _use_lookup_table(input_arr, input_vals, dtype):
+    """Whether `map_array` can gather the output from a dense lookup table.
+
+    The table is indexed by the values of `input_arr`: it has to be smaller
+    than the input array (and `_MAX_LUT_BYTES`), and the values of
+    `input_arr` have to be non-negative.
+    """
+    if input_vals.size == 0 or not np.can_cast(input_arr.dtype, np.intp):
+        return False
+    if np.min(input_vals) < 0:
+        return False
+    lut_size = int(np.max(input_vals)) + 2
+    if (lut_size > input_arr.size
+            or lut_size * np.dtype(dtype).itemsize > _MAX_LUT_BYTES):
+        return False
+    # negative values would be clipped to the first element of the table
+    return input_arr.dtype.kind == 'u' or np.min(input_arr) >= 0
+
+
 class ArrayMap:
     """Class designed to mimic mapping by NumPy array indexing.
 
@@ -108,10 +138,13 @@ class ArrayMap:
         self.out_values = out_values
         self._max_str_lines = 4
         self._array = None
+        # `in_values` array and whether it is strictly increasing
+        self._sorted_in_values = (None, False)
 
     def __len__(self):
         """Return one more than the maximum label value being remapped."""
-        return np.max(self.in_values) + 1
+        # Python int, as ``np.uint64 + 1`` is a float
+        return int(np.max(self.in_values)) + 1
 
     def __array__(self, dtype=None):
         """Return an array that behaves like the arraymap when indexed.
@@ -121,7 +154,7 @@ class ArrayMap:
         """
         if dtype is None:
             dtype = self.out_values.dtype
-        output = np.zeros(np.max(self.in_values) + 1, dtype=dtype)
+        output = np.zeros(len(self), dtype=dtype)
         output[self.in_values] = self.out_values
         return output
 
@@ -155,7 +188,25 @@ class ArrayMap:
     def __call__(self, arr):
         return self.__getitem__(arr)
 
+    def _in_values_sorted(self):
+        """Whether `in_values` is strictly increasing."""
+        in_values, is_sorted = self._sorted_in_values
+        if in_values is not self.in_values:
+            in_values = self.in_values
+            is_sorted = bool(np.all(in_values[1:] > in_values[:-1]))
+            self._sorted_in_values = (in_values, is_sorted)
+        return is_sorted
+
     def __getitem__(self, index):
+        if (isinstance(index, (int, np.integer))
+                and not isinstance(index, bool)
+                and self._in_values_sorted()):
+            # binary search for a single value, without the overhead of
+            # building an array and calling `map_array`
+            pos = np.searchsorted(self.in_values, index)
+            if pos < len(self.in_values) and self.in_values[pos] == index:
+                return self.out_values[pos]
+            return self.out_values.dtype.type(0)
         scalar = np.isscalar(index)
         if scalar:
             index = np.array([index])
@@ -179,6 +230,13 @@ class ArrayMap:
             out = out[0]
         return out
 
+    def __getstate__(self):
+        # The dense array materialized by `__setitem__` can be very large and
+        # is equivalent to `in_values` and `out_values`, so it is not pickled.
+        state = self.__dict__.copy()
+        state['_array'] = None
+        return state
+
     def __setitem__(self, indices, values):
         if self._array is None:
             self._array = self.__array__()
@@ -1,7 +1,6 @@
 import numpy as np
 
 from .._shared import utils
-from .. import exposure
 
 __all__ = ['montage']
 
@@ -109,6 +108,9 @@ def montage(arr_in, fill='mean', rescale_intensity=False, grid_shape=None,
 
     # Rescale intensity if necessary
     if rescale_intensity:
+        # imported here since skimage.exposure depends on skimage.color,
+        # which is otherwise not needed by skimage.util
+        from .. import exposure
         for i in range(n_images):
             arr_in[i] = exposure.rescale_intensity(arr_in[i])
 
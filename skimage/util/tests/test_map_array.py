@@ -1,7 +1,10 @@
+import pickle
+
 import numpy as np
 from skimage.util._map_array import map_array, ArrayMap
 
 from skimage._shared import testing
+from skimage._shared.testing import assert_array_equal
 
 
 def test_map_array_incorrect_output_shape():
@@ -50,3 +53,57 @@ def test_arraymap_bool_index():
     positive[0] = False
     m[positive] += 1
     assert np.all(m[image] >= 1)
+
+
+@testing.parametrize('in_values', [[0, 3, 7, 100], [7, 0, 100, 3]])
+def test_arraymap_scalar_index(in_values):
+    in_values = np.array(in_values)
+    out_values = np.array([0.5, 1.5, 2.5, 3.5])
+    m = ArrayMap(in_values, out_values)
+    indices = np.arange(110)
+    expected = m[indices]
+    for i in indices:
+        value = m[int(i)]
+        assert value == m[i] == expected[i]
+        assert value.dtype == out_values.dtype
+    m[3] = 10
+    assert m[3] == 10
+
+
+def test_arraymap_uint64_in_values():
+    m = ArrayMap(np.array([1, 1000], dtype=np.uint64), np.array([0.5, 1.5]))
+    assert len(m) == 1001
+    array = np.asarray(m)
+    assert array.shape == (1001,)
+    assert array[1] == 0.5 and array[1000] == 1.5
+
+
+def test_arraymap_pickle():
+    m = ArrayMap(np.array([1, 1000]), np.array([0.5, 1.5]))
+    m[3] = 2.5
+    unpickled = pickle.loads(pickle.dumps(m))
+    # the dense array is not pickled, only the mapped values
+    assert unpickled._array is None
+    assert_array_equal(unpickled.in_values, [1, 3, 1000])
+    assert_array_equal(unpickled.out_values, [0.5, 2.5, 1.5])
+    unpickled[4] = 3.5
+    assert_array_equal(unpickled[np.arange(6)], [0, 0.5, 0, 2.5, 3.5, 0])
+
+
+@testing.parametrize('dtype', [np.uint8, np.int16, np.int64])
+def test_map_array_lookup_table(dtype):
+    # small non-negative `input_vals` are mapped with a lookup table, which
+    # must give the same result as the general implementation
+    rng = np.random.default_rng(0)
+    labels = rng.integers(0, 40, size=(30, 30)).astype(dtype)
+    if np.issubdtype(dtype, np.signedinteger):
+        labels[0, :5] = -3
+    in_values = np.array([0, 2, 5, 30])
+    out_values = np.array([10., 20., 30., 40.])
+    expected = np.zeros(labels.shape)
+    for i, o in zip(in_values, out_values):
+        expected[labels == i] = o
+    assert_array_equal(map_array(labels, in_values, out_values), expected)
+    out = np.empty(labels.size * 2)[::2]
+    map_array(labels.ravel(), in_values, out_values, out=out)
+    assert_array_equal(out, expected.ravel())